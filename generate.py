@@ -4,6 +4,7 @@ import argparse
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
@@ -12,7 +13,7 @@ from src.theme import make_seed_and_theme
 from src.scrape import scrape_bundle
 from src.render import render_frames
 from src.audio import render_audio_wav
-from src.ffmpeg_utils import encode_video_from_frames, mux_audio_video
+from src.ffmpeg_utils import encode_av_from_raw_pipe, close_raw_pipe
 
 
 def load_cfg(path: str) -> dict:
@@ -33,6 +34,7 @@ def main():
     h = int(cfg["video"]["height"])
     fps = int(cfg["video"]["fps"])
     duration_s = float(cfg["video"]["duration_s"])
+    enc = cfg.get("encode", {})
 
     seed, theme = make_seed_and_theme(cfg.get("seed", "AUTO"))
     print(f"[seed] {seed}")
@@ -40,13 +42,10 @@ def main():
 
     with tempfile.TemporaryDirectory() as td:
         td = Path(td)
-        frames_dir = td / "frames"
-        frames_dir.mkdir(parents=True, exist_ok=True)
 
         # 1) scrape text + images based on theme
         bundle = scrape_bundle(cfg, theme, td)
 
-        # 2) render frames
         meta = {
             "seed": seed,
             "theme": theme,
@@ -55,22 +54,35 @@ def main():
             "h": h,
             "duration_s": duration_s,
         }
-        render_frames(cfg, meta, bundle, frames_dir)
 
-        # 3) generate audio
+        # 2) audio is independent of the frames: synthesize it on a side
+        #    thread (numpy releases the GIL) while the first frames render
         wav_path = td / "audio.wav"
-        render_audio_wav(cfg, meta, bundle, str(wav_path))
-
-        # 4) encode silent video then mux audio
-        silent_mp4 = td / "silent.mp4"
-        encode_video_from_frames(
-            frames_glob=str(frames_dir / "frame_%06d.png"),
+        with ThreadPoolExecutor(max_workers=1) as audio_pool:
+            audio_job = audio_pool.submit(render_audio_wav, cfg, meta, bundle, str(wav_path))
+            frames = render_frames(cfg, meta, bundle)
+            first = next(frames, b"")
+            audio_job.result()
+
+        # 3) one ffmpeg pass: raw rgb24 frames over stdin + the wav, muxed
+        #    straight into the output
+        proc = encode_av_from_raw_pipe(
             fps=fps,
             width=w,
             height=h,
-            out_mp4=str(silent_mp4),
+            audio_wav=str(wav_path),
+            out_mp4=out_path,
+            crf=int(enc.get("crf", 26)),
+            preset=enc.get("preset", "veryfast"),
+            encoder=enc.get("encoder", "libx264"),
+            audio_bitrate=enc.get("audio_bitrate", "128k"),
         )
-        mux_audio_video(str(silent_mp4), str(wav_path), out_path)
+        try:
+            proc.stdin.write(first)
+            for buf in frames:
+                proc.stdin.write(buf)
+        finally:
+            close_raw_pipe(proc)
 
     # Ensure output exists
     if not Path(out_path).exists():
@@ -6,45 +6,59 @@ from typing import Dict
 import numpy as np
 
 
-def _tone(freq, t):
-    return np.sin(2 * math.pi * freq * t)
+def _tone(freq, t, out=None):
+    out = np.multiply(t, 2 * math.pi * freq, out=out)
+    return np.sin(out, out=out)
 
 
 def _env(t, a=0.01, d=0.2, s=0.6, r=0.2, dur=1.0):
-    # simple ADSR envelope
-    out = np.zeros_like(t)
-    attack = a
-    decay = d
-    release = r
-    sustain_level = s
-    sustain_time = max(0.0, dur - (attack + decay + release))
-    # segments
-    for i, ti in enumerate(t):
-        if ti < attack:
-            out[i] = (ti / max(1e-6, attack))
-        elif ti < attack + decay:
-            x = (ti - attack) / max(1e-6, decay)
-            out[i] = 1.0 + (sustain_level - 1.0) * x
-        elif ti < attack + decay + sustain_time:
-            out[i] = sustain_level
-        elif ti < dur:
-            x = (ti - (attack + decay + sustain_time)) / max(1e-6, release)
-            out[i] = sustain_level * (1.0 - x)
-        else:
-            out[i] = 0.0
+    # simple ADSR envelope, built segment by segment from sample counts
+    n = len(t)
+    sr = 1.0 / float(t[1] - t[0]) if n > 1 else 1.0
+    na, nd, nr = int(a * sr), int(d * sr), int(r * sr)
+    ns = max(0, int(dur * sr) - (na + nd + nr))
+    env = np.concatenate([
+        np.linspace(0.0, 1.0, na, endpoint=False),
+        np.linspace(1.0, s, nd, endpoint=False),
+        np.full(ns, s),
+        np.linspace(s, 0.0, nr),
+    ])[:n]
+    out = np.zeros(n, dtype=np.float32)
+    out[:len(env)] = env
     return out
 
 
-def _noise(n):
-    return np.random.uniform(-1, 1, size=n)
+def _noise(n, gen: np.random.Generator):
+    # uniform [-1, 1) drawn directly as float32
+    x = gen.random(n, dtype=np.float32)
+    x *= 2.0
+    x -= 1.0
+    return x
+
+
+def _soft_sat(x):
+    """
+    In-place tanh-like saturation: the [3/2] Pade approximant
+    x*(27+x^2)/(27+9x^2), which reaches exactly ±1 with zero slope at |x|=3,
+    so clamping the input there keeps the curve smooth.
+    """
+    np.clip(x, -3.0, 3.0, out=x)
+    x2 = np.square(x)
+    den = x2 * 9.0
+    den += 27.0
+    x2 += 27.0
+    x *= x2
+    x /= den
+    return x
 
 
 def _clip(x):
-    return np.clip(x, -1.0, 1.0)
+    return np.clip(x, -1.0, 1.0, out=x)
 
 
 def _write_wav(path, sr, audio_float):
-    audio = (audio_float * 32767.0).astype(np.int16)
+    # scale in float32 (no float64 temporary), then a single cast to int16
+    audio = np.multiply(audio_float, 32767.0, dtype=np.float32).astype(np.int16)
     with wave.open(path, "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
@@ -59,35 +73,57 @@ def render_audio_wav(cfg: dict, meta: dict, bundle: dict, out_wav: str):
     t = np.arange(n, dtype=np.float32) / sr
 
     rng = random.Random(meta["theme"]["rng_int"])
+    nprng = np.random.default_rng(meta["theme"]["rng_int"])
+
+    # full-length float32 workspace shared by the tone generators below
+    scratch = np.empty(n, dtype=np.float32)
 
     # Base: tape hiss + low rumble
-    hiss = _noise(n) * 0.06
-    rumble = _tone(36 + rng.randint(-3, 3), t) * 0.10
-    rumble += _tone(72 + rng.randint(-6, 6), t) * 0.05
+    hiss = _noise(n, nprng)
+    hiss *= 0.06
+    rumble = _tone(36 + rng.randint(-3, 3), t, out=np.empty(n, dtype=np.float32))
+    rumble *= 0.10
+    _tone(72 + rng.randint(-6, 6), t, out=scratch)
+    scratch *= 0.05
+    rumble += scratch
 
     # Creepy “unstable” drones
-    lfo = (0.5 + 0.5 * np.sin(2 * math.pi * (0.08 + rng.random() * 0.05) * t)).astype(np.float32)
+    lfo = _tone(0.08 + rng.random() * 0.05, t, out=np.empty(n, dtype=np.float32))
+    lfo *= 0.5
+    lfo += 0.5
     drone_f = 110 + rng.randint(-20, 20)
-    drone = _tone(drone_f, t) * (0.08 + 0.08 * lfo)
-    drone += _tone(drone_f * 0.5, t) * (0.06 + 0.06 * (1 - lfo))
+    drone = _tone(drone_f, t, out=np.empty(n, dtype=np.float32))
+    drone *= (0.08 + 0.08 * lfo)
+    _tone(drone_f * 0.5, t, out=scratch)
+    scratch *= (0.06 + 0.06 * (1 - lfo))
+    drone += scratch
 
     # Sparse “PSA-ish” melodic fragments but warped (very low in mix)
     notes = [220, 247, 196, 165, 196, 220]
     frag = np.zeros(n, dtype=np.float32)
     step = int(sr * 0.9)
-    for i, f in enumerate(notes):
+    count = min(len(notes), -(-n // step))
+    freqs = np.array(notes[:count], dtype=np.float32)
+    dets = np.array([(rng.random() * 2 - 1) * 3.0 for _ in range(count)], dtype=np.float32)
+    # all notes share one time base, so synthesize them as a (count, step) matrix
+    tt = np.arange(step, dtype=np.float32) / sr
+    twopi_tt = (2 * math.pi) * tt
+    voices = np.sin(np.outer(freqs + dets, twopi_tt)) * 0.06
+    voices += np.sin(np.outer(freqs * 2 + dets, twopi_tt)) * 0.02
+    full = min(count, n // step)
+    voices[:full] *= _env(tt, dur=tt[-1])
+    for i in range(count):
         start = i * step
-        if start >= n:
-            break
         length = min(step, n - start)
-        tt = np.arange(length, dtype=np.float32) / sr
-        det = (rng.random() * 2 - 1) * 3.0
-        wave1 = _tone(f + det, tt) * 0.06
-        wave2 = _tone((f * 2) + det, tt) * 0.02
-        env = _env(tt, dur=tt[-1] if len(tt) > 1 else 0.1)
-        frag[start:start + length] += (wave1 + wave2) * env
+        if i >= full:
+            # truncated last note: fit its envelope to the shorter length
+            voices[i, :length] *= _env(tt[:length], dur=tt[length - 1] if length > 1 else 0.1)
+        frag[start:start + length] += voices[i, :length]
     # tape wobble on fragment
-    frag *= (0.7 + 0.3 * np.sin(2 * math.pi * 0.3 * t))
+    _tone(0.3, t, out=scratch)
+    scratch *= 0.3
+    scratch += 0.7
+    frag *= scratch
 
     # Jumpscare stingers: abrupt noise + sine spike
     jumps = cfg.get("jumpscares", {})
@@ -101,22 +137,31 @@ def render_audio_wav(cfg: dict, meta: dict, bundle: dict, out_wav: str):
             events.append(s + rng.random())
 
     sting = np.zeros(n, dtype=np.float32)
+    spans, spike_fs, decays = [], [], []
     for et in events:
         start = int(et * sr)
         length = int(sr * (0.18 + rng.random() * 0.22))
         end = min(n, start + length)
         if end <= start:
             continue
-        tt = np.arange(end - start, dtype=np.float32) / sr
-        burst = _noise(end - start) * 0.9
-        spike_f = rng.choice([700, 900, 1200, 1500, 2400, 3200])
-        spike = _tone(spike_f, tt) * 0.6
-        env = np.exp(-tt * (10 + rng.random() * 20)).astype(np.float32)
-        sting[start:end] += (burst + spike) * env
+        spans.append((start, end))
+        spike_fs.append(rng.choice([700, 900, 1200, 1500, 2400, 3200]))
+        decays.append(10 + rng.random() * 20)
+    if spans:
+        # every stinger fits in the worst-case length: build them as one matrix
+        maxlen = max(end - start for start, end in spans)
+        tt = np.arange(maxlen, dtype=np.float32) / sr
+        stings = _noise(len(spans) * maxlen, nprng).reshape(len(spans), maxlen)
+        stings *= 0.9
+        stings += np.sin(np.outer(np.array(spike_fs, dtype=np.float32), (2 * math.pi) * tt)) * 0.6
+        stings *= np.exp(-np.outer(np.array(decays, dtype=np.float32), tt))
+        for k, (start, end) in enumerate(spans):
+            sting[start:end] += stings[k, :end - start]
 
     # Final mix with gentle tape saturation
     audio = hiss + rumble + drone + (frag * 0.6) + sting * 0.8
-    audio = np.tanh(audio * 1.6)  # saturation / tape compression
+    audio *= 1.6
+    audio = _soft_sat(audio)  # saturation / tape compression
     audio *= 0.9
 
     _write_wav(out_wav, sr, _clip(audio))
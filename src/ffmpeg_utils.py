@@ -1,38 +1,87 @@
 import subprocess
+from functools import lru_cache
 
+# hardware encoders tried, in order, when encoder="auto"
+HW_ENCODERS = ["h264_nvenc", "h264_qsv", "h264_videotoolbox"]
 
-def _run(cmd):
-    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-    if p.returncode != 0:
-        raise RuntimeError(f"ffmpeg failed:\n{p.stdout}")
 
-
-def encode_video_from_frames(frames_glob: str, fps: int, width: int, height: int, out_mp4: str,
-                             crf: int = 26, preset: str = "veryfast"):
+@lru_cache(maxsize=None)
+def encoder_available(name: str) -> bool:
+    """
+    True if ffmpeg lists `name` and can actually open it (hardware encoders
+    are often compiled in without a usable device behind them).
+    """
+    try:
+        p = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"],
+                           stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    except OSError:
+        return False
+    if f" {name} " not in p.stdout:
+        return False
     cmd = [
-        "ffmpeg", "-y",
-        "-framerate", str(fps),
-        "-i", frames_glob,
-        "-vf", f"scale={width}:{height}:flags=neighbor",
-        "-c:v", "libx264",
-        "-pix_fmt", "yuv420p",
-        "-preset", str(preset),
-        "-crf", str(crf),
-        out_mp4
+        "ffmpeg", "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+        "-c:v", name,
+        "-f", "null", "-"
     ]
-    _run(cmd)
+    return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+
+
+def resolve_encoder(encoder: str) -> str:
+    if encoder != "auto":
+        return encoder
+    for name in HW_ENCODERS:
+        if encoder_available(name):
+            return name
+    return "libx264"
 
 
-def mux_audio_video(video_mp4: str, audio_wav: str, out_mp4: str, audio_bitrate: str = "128k"):
+def _video_codec_args(encoder: str, crf: int, preset: str):
+    if encoder == "h264_nvenc":
+        return ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", str(crf), "-b:v", "0",
+                "-pix_fmt", "yuv420p"]
+    if encoder == "h264_qsv":
+        return ["-c:v", "h264_qsv", "-preset", "veryfast", "-global_quality", str(crf),
+                "-pix_fmt", "nv12"]
+    if encoder == "h264_videotoolbox":
+        return ["-c:v", "h264_videotoolbox", "-b:v", "6M", "-pix_fmt", "yuv420p"]
+    return ["-c:v", encoder, "-preset", str(preset), "-crf", str(crf), "-threads", "0",
+            "-pix_fmt", "yuv420p"]
+
+
+def encode_av_from_raw_pipe(fps: int, width: int, height: int, audio_wav: str, out_mp4: str,
+                            crf: int = 26, preset: str = "veryfast", encoder: str = "libx264",
+                            audio_bitrate: str = "128k") -> subprocess.Popen:
+    """
+    Start a single-pass encoder: packed rgb24 frames from stdin plus `audio_wav`,
+    muxed straight into `out_mp4` (no silent intermediate).
+    Write width*height*3 bytes per frame to proc.stdin, then call close_raw_pipe(proc).
+    `encoder` is an ffmpeg H.264 encoder name, or "auto" to prefer a working hardware one.
+    """
     cmd = [
         "ffmpeg", "-y",
-        "-i", video_mp4,
+        "-hide_banner", "-loglevel", "error",
+        "-f", "rawvideo",
+        "-pix_fmt", "rgb24",
+        "-s", f"{width}x{height}",
+        "-framerate", str(fps),
+        "-i", "-",
         "-i", audio_wav,
-        "-c:v", "copy",
+        *_video_codec_args(resolve_encoder(encoder), crf, preset),
         "-c:a", "aac",
         "-b:a", str(audio_bitrate),
         "-shortest",
         out_mp4
     ]
-    _run(cmd)
+    return subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+
+def close_raw_pipe(proc: subprocess.Popen):
+    try:
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass
+    err = proc.stderr.read().decode("utf-8", "replace")
+    if proc.wait() != 0:
+        raise RuntimeError(f"ffmpeg failed:\n{err}")
 
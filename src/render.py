@@ -1,21 +1,63 @@
 import math
+import multiprocessing
+import os
 import random
-from pathlib import Path
-from typing import List
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterator, List
 
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont, ImageEnhance
+from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageOps
 
-from .vhs import apply_vhs, to_grayscale
+from .vhs import apply_vhs_arr, to_grayscale
 
 
-def _font(size: int):
+@lru_cache(maxsize=1)
+def _font_name():
+    # walk the fallback chain once; every size after that loads the winner
     for name in ["DejaVuSansMono.ttf", "DejaVuSans.ttf", "Arial.ttf"]:
         try:
-            return ImageFont.truetype(name, size=size)
+            ImageFont.truetype(name, size=12)
+            return name
         except Exception:
             continue
-    return ImageFont.load_default()
+    return None
+
+
+@lru_cache(maxsize=32)
+def _font(size: int):
+    name = _font_name()
+    if name is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(name, size=size)
+
+
+@lru_cache(maxsize=1024)
+def _text_tile(text: str, size: int):
+    """
+    Rasterize `text` once as an L mask. Returns (mask, (dx, dy), advance),
+    where (dx, dy) is the ink offset from the draw.text origin.
+    """
+    font = _font(size)
+    l, t, r, b = font.getbbox(text)
+    mask = Image.new("L", (max(1, r - l), max(1, b - t)), 0)
+    ImageDraw.Draw(mask).text((-l, -t), text, font=font, fill=255)
+    return mask, (l, t), font.getlength(text)
+
+
+def _blit_text(draw: ImageDraw.ImageDraw, xy, text: str, size: int, fill, per_glyph: bool = False):
+    """
+    draw.text() replacement for overlay strings that repeat across frames:
+    blits cached masks instead of running FreeType every frame. With
+    per_glyph, the string is assembled from single-character tiles (for
+    timecodes and random IDs, which rarely repeat but use few glyphs).
+    """
+    x, y = xy
+    for part in (text if per_glyph else (text,)):
+        mask, (dx, dy), advance = _text_tile(part, size)
+        draw.bitmap((int(round(x + dx)), y + dy), mask, fill=fill)
+        x += advance
 
 
 def letterbox(img: Image.Image, w: int, h: int) -> Image.Image:
@@ -28,33 +70,51 @@ def letterbox(img: Image.Image, w: int, h: int) -> Image.Image:
     return canvas
 
 
-def make_noise_plate(w: int, h: int) -> Image.Image:
-    arr = np.random.randint(0, 255, size=(h, w), dtype=np.uint8)
-    return Image.fromarray(arr, mode="L").convert("RGB")
+def make_noise_plate(w: int, h: int, gen: np.random.Generator) -> Image.Image:
+    # raw PCG64 bytes are the cheapest uniform uint8 fill numpy offers;
+    # wrap them without copying, Pillow's L -> RGB expand is faster than
+    # building the three channels in numpy
+    return Image.frombuffer("L", (w, h), gen.bytes(w * h), "raw", "L", 0, 1).convert("RGB")
 
 
-def ken_burns(img: Image.Image, w: int, h: int, t: float, rng: random.Random) -> Image.Image:
+def ken_burns_setup(img: Image.Image, rng: random.Random) -> tuple:
     """
-    Slow creepy zoom/pan on the image. t in [0,1].
+    Pick the zoom/pan track for one image: (base, z1, pan fractions).
+    Done once per chapter and image so the move is smooth across frames.
     """
-    base = img.convert("RGB")
+    base = img if img.mode == "RGB" else img.convert("RGB")
     # choose a stable-ish zoom track per clip
-    z0 = 1.00
     z1 = 1.18 + rng.random() * 0.08
+    # pan targets, as fractions of the slack around the crop window
+    fx0 = 0.15 + rng.random() * 0.2
+    fy0 = 0.15 + rng.random() * 0.2
+    fx1 = 0.65 + rng.random() * 0.2
+    fy1 = 0.65 + rng.random() * 0.2
+    return base, z1, (fx0, fy0, fx1, fy1)
+
+
+def ken_burns_step(track: tuple, t: float, w: int, h: int) -> Image.Image:
+    """
+    Slow creepy zoom/pan: one frame of a ken_burns_setup() track. t in [0,1].
+    """
+    base, z1, (fx0, fy0, fx1, fy1) = track
+    z0 = 1.00
     z = z0 + (z1 - z0) * (0.5 - 0.5 * math.cos(math.pi * t))  # smooth
-    # pan targets
     W, H = base.size
     cw = int(W / z)
     ch = int(H / z)
-    cx0 = int((W - cw) * (0.15 + rng.random() * 0.2))
-    cy0 = int((H - ch) * (0.15 + rng.random() * 0.2))
-    cx1 = int((W - cw) * (0.65 + rng.random() * 0.2))
-    cy1 = int((H - ch) * (0.65 + rng.random() * 0.2))
+    cx0 = int((W - cw) * fx0)
+    cy0 = int((H - ch) * fy0)
+    cx1 = int((W - cw) * fx1)
+    cy1 = int((H - ch) * fy1)
     cx = int(cx0 + (cx1 - cx0) * t)
     cy = int(cy0 + (cy1 - cy0) * t)
-    crop = base.crop((cx, cy, cx + cw, cy + ch))
-    crop = crop.resize((w, h), Image.NEAREST)
-    return crop
+    # resample straight from the source window: no intermediate crop copy
+    return base.resize((w, h), Image.NEAREST, box=(cx, cy, cx + cw, cy + ch))
+
+
+# redaction runs are at most 18 chars; slice instead of building "█" * n
+_BLOCKS = "█" * 32
 
 
 def redact_line(s: str, rng: random.Random) -> str:
@@ -68,7 +128,7 @@ def redact_line(s: str, rng: random.Random) -> str:
         # replace a chunk with blocks
         a = rng.randint(10, max(10, len(s)//2))
         b = min(len(s), a + rng.randint(8, 18))
-        s = s[:a] + "█" * (b - a) + s[b:]
+        s = s[:a] + _BLOCKS[:b - a] + s[b:]
     # occasional tag prefix
     if rng.random() < 0.25:
         s = f"[{rng.randint(10,99)}.{rng.randint(10,99)}] {s}"
@@ -76,12 +136,8 @@ def redact_line(s: str, rng: random.Random) -> str:
 
 
 def overlay_vhs_osd(draw: ImageDraw.ImageDraw, w: int, h: int, meta: dict, cfg_overlay: dict, frame_idx: int, rng: random.Random, room_label: str):
-    f_small = _font(16)
-    f_med = _font(20)
-    f_big = _font(26)
-
     # REC + dot
-    draw.text((26, 18), "REC", font=f_big, fill=(235, 235, 235))
+    _blit_text(draw, (26, 18), "REC", 26, (235, 235, 235))
     draw.ellipse((10, 24, 22, 36), fill=(235, 235, 235))
 
     fps = meta["fps"]
@@ -91,7 +147,7 @@ def overlay_vhs_osd(draw: ImageDraw.ImageDraw, w: int, h: int, meta: dict, cfg_o
     ss = int(seconds % 60)
     ff = int(frame_idx % fps)
     tc = f"{hh:02d}:{mm:02d}:{ss:02d}:{ff:02d}"
-    draw.text((w - 200, 18), tc, font=f_med, fill=(235, 235, 235))
+    _blit_text(draw, (w - 200, 18), tc, 20, (235, 235, 235), per_glyph=True)
 
     seed_int = meta["theme"]["rng_int"]
     day = 1 + (seed_int % 28)
@@ -103,16 +159,15 @@ def overlay_vhs_osd(draw: ImageDraw.ImageDraw, w: int, h: int, meta: dict, cfg_o
     cam = rng.choice(cfg_overlay.get("camera_pool", ["CAM"]))
     track = 18 + int(42 * (0.5 + 0.5 * math.sin(frame_idx * 0.03)))
 
-    draw.text((24, h - 50), f"{date}  {loc}  {cam}", font=f_small, fill=(235, 235, 235))
-    draw.text((w - 300, h - 50), f"TRK {track:02d}  SP", font=f_small, fill=(235, 235, 235))
-    draw.text((24, 52), room_label, font=f_small, fill=(220, 220, 220))
+    _blit_text(draw, (24, h - 50), f"{date}  {loc}  {cam}", 16, (235, 235, 235))
+    _blit_text(draw, (w - 300, h - 50), f"TRK {track:02d}  SP", 16, (235, 235, 235))
+    _blit_text(draw, (24, 52), room_label, 16, (220, 220, 220))
 
     draw.rectangle((6, 6, w - 6, h - 6), outline=(90, 90, 90), width=2)
 
 
 def glitch_errors(draw: ImageDraw.ImageDraw, w: int, h: int, rng: random.Random, brain: str):
     if rng.random() < 0.26:
-        f = _font(18)
         msgs = [
             "ERROR: DROP FRAME",
             "SYNC LOST",
@@ -126,17 +181,15 @@ def glitch_errors(draw: ImageDraw.ImageDraw, w: int, h: int, rng: random.Random,
         msg = rng.choice(msgs)
         x = rng.randint(40, max(41, w - 340))
         y = rng.randint(80, max(81, h - 120))
-        draw.text((x, y), msg, font=f, fill=(235, 235, 235))
+        _blit_text(draw, (x, y), msg, 18, (235, 235, 235))
 
 
 def draw_infographic(d: ImageDraw.ImageDraw, x: int, y: int, w: int, h: int, rng: random.Random, title: str):
     """
     Creepy nonsense chart panel (looks like a VHS-era diagnostic overlay).
     """
-    f_t = _font(16)
-    f_s = _font(14)
     d.rectangle((x, y, x + w, y + h), outline=(180, 180, 180), width=2)
-    d.text((x + 10, y + 8), title, font=f_t, fill=(235, 235, 235))
+    _blit_text(d, (x + 10, y + 8), title, 16, (235, 235, 235))
 
     # axes
     ax_y0 = y + 32
@@ -154,80 +207,78 @@ def draw_infographic(d: ImageDraw.ImageDraw, x: int, y: int, w: int, h: int, rng
         val = rng.random()
         py = ax_y1 - int((ax_y1 - ax_y0) * (0.15 + 0.75 * val))
         pts.append((px, py))
-    for i in range(len(pts) - 1):
-        d.line((pts[i][0], pts[i][1], pts[i + 1][0], pts[i + 1][1]), fill=(235, 235, 235), width=2)
+    d.line(pts, fill=(235, 235, 235), width=2)
 
     # labels
-    d.text((ax_x0, ax_y1 + 2), "t", font=f_s, fill=(200, 200, 200))
-    d.text((ax_x1 - 20, ax_y0 - 18), "lvl", font=f_s, fill=(200, 200, 200))
+    _blit_text(d, (ax_x0, ax_y1 + 2), "t", 14, (200, 200, 200))
+    _blit_text(d, (ax_x1 - 20, ax_y0 - 18), "lvl", 14, (200, 200, 200))
 
     # nonsense stats
     s1 = f"DRIFT {rng.randint(2,19)}%"
     s2 = f"CRC {rng.randint(100000,999999)}"
     s3 = f"NF {rng.randint(18,44)}dB"
-    d.text((x + 10, y + h - 52), s1, font=f_s, fill=(220, 220, 220))
-    d.text((x + 10, y + h - 34), s2, font=f_s, fill=(220, 220, 220))
-    d.text((x + 10, y + h - 16), s3, font=f_s, fill=(220, 220, 220))
+    _blit_text(d, (x + 10, y + h - 52), s1, 14, (220, 220, 220))
+    _blit_text(d, (x + 10, y + h - 34), s2, 14, (220, 220, 220), per_glyph=True)
+    _blit_text(d, (x + 10, y + h - 16), s3, 14, (220, 220, 220))
 
 
-def card_screen(w: int, h: int, title: str, lines: List[str], rng: random.Random, brain: str) -> Image.Image:
+def card_screen(w: int, h: int, title: str, lines: List[str], rng: random.Random, brain: str):
+    """
+    Text card on black. Returns (img, draw) so the caller can keep drawing.
+    """
     img = Image.new("RGB", (w, h), (0, 0, 0))
     d = ImageDraw.Draw(img)
-    f_title = _font(40)
-    f_body = _font(20)
 
-    d.text((56, 72), title, font=f_title, fill=(235, 235, 235))
+    _blit_text(d, (56, 72), title, 40, (235, 235, 235))
     y = 142
     for ln in lines[:16]:
-        d.text((56, y), ln, font=f_body, fill=(210, 210, 210))
+        _blit_text(d, (56, y), ln, 20, (210, 210, 210))
         y += 28
 
     # infographic panel on cards
     draw_infographic(d, w - 320, 90, 260, 160, rng, f"{brain.upper()} / DIAG")
 
-    return img
+    return img, d
 
 
-def dossier_overlay(img: Image.Image, rng: random.Random, brain: str, anchor: str, title_hint: str):
+def dossier_overlay(d: ImageDraw.ImageDraw, w: int, h: int, rng: random.Random, brain: str, anchor: str, title_hint: str):
     """
     Overlays “scraped document” vibe over an image:
     stamps, IDs, redaction bars, annotations.
     """
-    d = ImageDraw.Draw(img)
-    f = _font(18)
-    f2 = _font(14)
 
     # top stamp
     d.rectangle((18, 18, 360, 64), outline=(220, 220, 220), width=2)
-    d.text((28, 28), f"{brain.upper()} / {title_hint}", font=f, fill=(235, 235, 235))
+    _blit_text(d, (28, 28), f"{brain.upper()} / {title_hint}", 18, (235, 235, 235))
 
     # case id
-    d.text((22, 78), f"ANCHOR: {anchor.upper()}", font=f2, fill=(210, 210, 210))
-    d.text((22, 96), f"REF: {rng.randint(1000,9999)}-{rng.randint(10,99)} / FIELD", font=f2, fill=(210, 210, 210))
+    _blit_text(d, (22, 78), f"ANCHOR: {anchor.upper()}", 14, (210, 210, 210))
+    _blit_text(d, (22, 96), f"REF: {rng.randint(1000,9999)}-{rng.randint(10,99)} / FIELD", 14, (210, 210, 210), per_glyph=True)
 
     # random redaction bars
     for _ in range(6):
         if rng.random() < 0.55:
             x = rng.randint(22, 420)
-            y = rng.randint(120, img.height - 60)
+            y = rng.randint(120, h - 60)
             ww = rng.randint(120, 360)
             hh = rng.randint(10, 18)
             d.rectangle((x, y, x + ww, y + hh), fill=(20, 20, 20))
 
     # margin notes
     if rng.random() < 0.7:
-        d.text((img.width - 320, 24), "NOTE:", font=f2, fill=(210, 210, 210))
-        d.text((img.width - 320, 44), f"{brain.upper()} PRESENT", font=f2, fill=(210, 210, 210))
-        d.text((img.width - 320, 64), "DO NOT PAUSE", font=f2, fill=(210, 210, 210))
+        _blit_text(d, (w - 320, 24), "NOTE:", 14, (210, 210, 210))
+        _blit_text(d, (w - 320, 44), f"{brain.upper()} PRESENT", 14, (210, 210, 210))
+        _blit_text(d, (w - 320, 64), "DO NOT PAUSE", 14, (210, 210, 210))
 
 
-def content_frame(w: int, h: int, base: Image.Image, text_lines: List[str], rng: random.Random, brain: str, anchor: str) -> Image.Image:
-    img = base.copy()
-    img = img.resize((w, h), Image.NEAREST)
-    dossier_overlay(img, rng, brain, anchor, "CAPTURE")
-
+def content_frame(w: int, h: int, base: Image.Image, text_lines: List[str], rng: random.Random, brain: str, anchor: str):
+    """
+    Photo frame with dossier marks and caption bar. Returns (img, draw).
+    """
+    # resize() already returns a fresh image (a plain copy when sizes match)
+    img = base.resize((w, h), Image.NEAREST)
     d = ImageDraw.Draw(img)
-    f = _font(18)
+    dossier_overlay(d, w, h, rng, brain, anchor, "CAPTURE")
 
     # bottom caption bar
     bar_h = 132
@@ -236,31 +287,33 @@ def content_frame(w: int, h: int, base: Image.Image, text_lines: List[str], rng:
 
     y = h - bar_h + 14
     for ln in text_lines[:4]:
-        d.text((26, y), ln, font=f, fill=(235, 235, 235))
+        _blit_text(d, (26, y), ln, 18, (235, 235, 235))
         y += 26
 
     # small nonsense diagram
     draw_infographic(d, w - 310, h - bar_h + 12, 284, 112, rng, "SIG / TRACE")
 
-    return img
+    return img, d
 
 
 def maybe_jumpscare_frame(img: Image.Image, rng: random.Random) -> Image.Image:
     # harsh flash + contrast; also occasional inverted look
     if rng.random() < 0.35:
-        inv = Image.fromarray(255 - np.array(img))
-        img = inv
+        img = ImageOps.invert(img)
     img = ImageEnhance.Contrast(img).enhance(2.1)
     img = ImageEnhance.Brightness(img).enhance(1.35)
     return img
 
 
-def render_frames(cfg: dict, meta: dict, bundle: dict, frames_dir: Path):
+def _plan_frames(cfg: dict, meta: dict, bundle: dict) -> dict:
+    """
+    Everything the frame loop needs that is shared across frames:
+    source images, text pools, jumpscare schedule, chapter timeline.
+    Built once in the parent and handed to every render worker.
+    """
     w, h = meta["w"], meta["h"]
     fps = meta["fps"]
 
-    style = cfg.get("style", {})
-    osd = cfg.get("overlay", {})
     chapters = cfg.get("chapters", [])
 
     rng = random.Random(meta["theme"]["rng_int"])
@@ -272,11 +325,26 @@ def render_frames(cfg: dict, meta: dict, bundle: dict, frames_dir: Path):
     bases = []
     for p in bundle.get("images", []):
         try:
-            bases.append(Image.open(p).convert("RGB"))
+            img = Image.open(p)
+            # ken_burns zooms in at most ~1.26x and stretches its crop to
+            # w x h regardless of aspect, so each axis needs no more than
+            # 1.3x the output; shrink the axes independently (never below
+            # that) once here. draft() lets JPEGs decode at a reduced scale
+            # that still covers the target on both axes.
+            tw, th = int(w * 1.3), int(h * 1.3)
+            img.draft("RGB", (tw, th))
+            img = img.convert("RGB")
+            size = (min(img.width, tw), min(img.height, th))
+            if size != img.size:
+                img = img.resize(size, Image.BOX)
+            bases.append(img)
         except Exception:
             pass
+    # pre-rendered oversized static for noise frames (and as stand-in images)
+    gen = np.random.default_rng(meta["theme"]["rng_int"])
+    noise_pool = [make_noise_plate(w + w // 4, h + h // 4, gen) for _ in range(6)]
     if not bases:
-        bases = [make_noise_plate(w, h) for _ in range(6)]
+        bases = noise_pool
 
     # text lines from scraped paragraphs (ARG-ified)
     paras = bundle.get("paragraphs", []) or ["The signal persists. The record continues. The room remains present."]
@@ -297,10 +365,9 @@ def render_frames(cfg: dict, meta: dict, bundle: dict, frames_dir: Path):
             break
         if rng.random() < prob:
             jump_events.append(tsec * fps + rng.randint(0, fps - 1))
-    jump_set = set()
+    jump_mask = np.zeros(total_frames, dtype=bool)
     for f0 in jump_events:
-        for k in range(flash_frames + hold_frames):
-            jump_set.add(f0 + k)
+        jump_mask[f0:f0 + flash_frames + hold_frames] = True
 
     # Timeline
     timeline = []
@@ -312,114 +379,241 @@ def render_frames(cfg: dict, meta: dict, bundle: dict, frames_dir: Path):
     if cursor < total_frames:
         timeline.append((cursor, total_frames, "ROOM: ATTIC"))
 
-    # room mapping from theme
+    # per-frame chapter index into timeline (-1 = no chapter)
+    chapter_of = np.full(total_frames, -1, dtype=np.int32)
+    for ci, (a, b, _) in enumerate(timeline):
+        chapter_of[a:b] = ci
+
+    # room mapping from theme, in the order the rooms appear on tape
     room_iter = iter(meta["theme"].get("rooms", []))
     room_cache = {}
-
-    prev_arr = None
-
-    for fi in range(total_frames):
-        # which chapter
-        ch_name = "CONTENT"
-        for a, b, name in timeline:
-            if a <= fi < b:
-                ch_name = name
-                ch_a, ch_b = a, b
-                break
-
-        # room label + “different recording”
-        room_label = "ROOM FEED"
-        room_note = "FIELD"
-        if ch_name.startswith("ROOM:"):
-            room = ch_name.split("ROOM:", 1)[1].strip()
+    for _, _, name in timeline:
+        if name.startswith("ROOM:"):
+            room = name.split("ROOM:", 1)[1].strip()
             if room not in room_cache:
                 try:
-                    rn = next(room_iter)
+                    room_cache[room] = next(room_iter)
                 except StopIteration:
-                    rn = (room, "field note / partial lock")
-                room_cache[room] = rn
-            room_label = f"{room_cache[room][0]} / {room_cache[room][1]}"
-        elif ch_name == "WARNING":
-            room_label = "TAPE LEADER / WARNING"
-        elif ch_name == "TECHNICAL NOTES":
-            room_label = "TAPE LEADER / TECH"
-
-        # chapter-local progress (for zoom/pan)
-        t = 0.0
-        if ch_name.startswith("ROOM:"):
-            t = (fi - ch_a) / max(1, (ch_b - ch_a - 1))
-
-        # build base frame
-        if ch_name == "WARNING":
-            tape_id = f"{osd.get('tape_id_prefix','TAPE')}-{(meta['theme']['rng_int']%9999):04d}"
-            lines = [
-                "THIS RECORDING CONTAINS UNVERIFIED MATERIAL",
-                "PLAYBACK MAY INDUCE DISORIENTATION",
-                f"TAPE ID: {tape_id}",
-                f"SEED: {meta['seed']}",
-                f"ORCHESTRATOR: {brain.upper()}",
-                "SOURCE: CONSUMER VHS / SP MODE",
-                "NOTE: DO NOT PAUSE ON ARTIFACTS",
-            ]
-            base = card_screen(w, h, "WARNING", lines, rng, brain)
-
-        elif ch_name == "TECHNICAL NOTES":
-            lines = [
-                f"ANCHOR: {anchor.upper()}",
-                f"PRIMARY: {(bundle.get('titles') or ['UNKNOWN'])[0]}",
-                "DECODE: FIELD SYNC / RF RECOVERY",
-                f"STATUS: {rng.choice(['PARTIAL LOCK','UNSTABLE','SOFT SYNC','DRIFTING'])}",
-                f"ROOM COUNT: {len([c for c in chapters if c['name'].startswith('ROOM:')])}",
-                "",
-            ] + tech_lines[:10]
-            base = card_screen(w, h, "TECHNICAL NOTES", lines, rng, brain)
-
-        elif ch_name.startswith("ROOM:"):
-            # choose a base image and apply slow zoom/pan
-            src = rng.choice(bases)
-            # if image is tiny or weird, letterbox after zooming
-            zoomed = ken_burns(src, w, h, t, rng)
-
-            # pick creepy “scraped” text
-            p = rng.choice(paras)
-            words = p.split()
-            if len(words) > 18:
-                # slice a coherent chunk
-                start = rng.randint(0, len(words) - 18)
-                chunk = " ".join(words[start:start + 18])
-            else:
-                chunk = p
-
-            ln1 = redact_line(chunk, rng)
-            ln2 = redact_line(rng.choice(paras), rng)
-            ln3 = redact_line(rng.choice(tech_lines), rng)
-            ln4 = redact_line(f"{brain.upper()} / ROOM INDEX {rng.randint(10,99)} / TAG {rng.randint(100,999)}", rng)
-
-            base = content_frame(w, h, zoomed, [ln1, ln2, ln3, ln4], rng, brain, anchor)
-
-        else:
-            base = make_noise_plate(w, h)
-
-        if cfg.get("style", {}).get("black_white", False):
+                    room_cache[room] = (room, "field note / partial lock")
+
+    return {
+        "cfg": cfg,
+        "meta": meta,
+        "brain": brain,
+        "anchor": anchor,
+        "titles": bundle.get("titles"),
+        "bases": bases,
+        "noise_pool": noise_pool,
+        "paras": paras,
+        "tech_lines": tech_lines,
+        "jump_mask": jump_mask,
+        "timeline": timeline,
+        "chapter_of": chapter_of,
+        "room_cache": room_cache,
+        "caption_frames": max(1, int(float(cfg.get("overlay", {}).get("caption_refresh_s", 1.0)) * fps)),
+        "total_frames": total_frames,
+    }
+
+
+def _caption_lines(plan: dict, rng: random.Random) -> List[str]:
+    paras, tech_lines, brain = plan["paras"], plan["tech_lines"], plan["brain"]
+
+    # pick creepy “scraped” text
+    p = rng.choice(paras)
+    words = p.split()
+    if len(words) > 18:
+        # slice a coherent chunk
+        start = rng.randint(0, len(words) - 18)
+        chunk = " ".join(words[start:start + 18])
+    else:
+        chunk = p
+
+    ln1 = redact_line(chunk, rng)
+    ln2 = redact_line(rng.choice(paras), rng)
+    ln3 = redact_line(rng.choice(tech_lines), rng)
+    ln4 = redact_line(f"{brain.upper()} / ROOM INDEX {rng.randint(10,99)} / TAG {rng.randint(100,999)}", rng)
+    return [ln1, ln2, ln3, ln4]
+
+
+def _render_frame(plan: dict, fi: int, rng: random.Random, prev_arr, cache: dict, out: np.ndarray):
+    """
+    Render frame `fi` into `out` (an HxWx3 uint8 array, not `prev_arr`)
+    and return it.
+    """
+    cfg, meta = plan["cfg"], plan["meta"]
+    w, h = meta["w"], meta["h"]
+    style = cfg.get("style", {})
+    osd = cfg.get("overlay", {})
+    chapters = cfg.get("chapters", [])
+    brain, anchor = plan["brain"], plan["anchor"]
+    bases, tech_lines = plan["bases"], plan["tech_lines"]
+
+    # which chapter
+    ch_name = "CONTENT"
+    ci = int(plan["chapter_of"][fi])
+    if ci >= 0:
+        ch_a, ch_b, ch_name = plan["timeline"][ci]
+
+    # room label + “different recording”
+    room_label = "ROOM FEED"
+    if ch_name.startswith("ROOM:"):
+        room = ch_name.split("ROOM:", 1)[1].strip()
+        rn = plan["room_cache"][room]
+        room_label = f"{rn[0]} / {rn[1]}"
+    elif ch_name == "WARNING":
+        room_label = "TAPE LEADER / WARNING"
+    elif ch_name == "TECHNICAL NOTES":
+        room_label = "TAPE LEADER / TECH"
+
+    # chapter-local progress (for zoom/pan)
+    is_room = ch_name.startswith("ROOM:")
+    t = 0.0
+    if is_room:
+        t = (fi - ch_a) / max(1, (ch_b - ch_a - 1))
+
+    # build base frame
+    if ch_name == "WARNING":
+        tape_id = f"{osd.get('tape_id_prefix','TAPE')}-{(meta['theme']['rng_int']%9999):04d}"
+        lines = [
+            "THIS RECORDING CONTAINS UNVERIFIED MATERIAL",
+            "PLAYBACK MAY INDUCE DISORIENTATION",
+            f"TAPE ID: {tape_id}",
+            f"SEED: {meta['seed']}",
+            f"ORCHESTRATOR: {brain.upper()}",
+            "SOURCE: CONSUMER VHS / SP MODE",
+            "NOTE: DO NOT PAUSE ON ARTIFACTS",
+        ]
+        base, d = card_screen(w, h, "WARNING", lines, rng, brain)
+
+    elif ch_name == "TECHNICAL NOTES":
+        lines = [
+            f"ANCHOR: {anchor.upper()}",
+            f"PRIMARY: {(plan['titles'] or ['UNKNOWN'])[0]}",
+            "DECODE: FIELD SYNC / RF RECOVERY",
+            f"STATUS: {rng.choice(['PARTIAL LOCK','UNSTABLE','SOFT SYNC','DRIFTING'])}",
+            f"ROOM COUNT: {len([c for c in chapters if c['name'].startswith('ROOM:')])}",
+            "",
+        ] + tech_lines[:10]
+        base, d = card_screen(w, h, "TECHNICAL NOTES", lines, rng, brain)
+
+    elif is_room:
+        # choose a base image and apply slow zoom/pan; each image keeps one
+        # track for the whole chapter, derived from (seed, chapter, image)
+        # so every worker agrees on it
+        bi = rng.randrange(len(bases))
+        kb_key = ("kb", ci, bi)
+        if kb_key not in cache:
+            cache[kb_key] = ken_burns_setup(bases[bi], random.Random(f"{meta['theme']['rng_int']}/kb/{ci}/{bi}"))
+        zoomed = ken_burns_step(cache[kb_key], t, w, h)
+
+        # creepy “scraped” caption, re-rolled every caption_refresh_s
+        slot = fi // plan["caption_frames"]
+        text_key = ("text", ci, slot)
+        if text_key not in cache:
+            cache[text_key] = _caption_lines(plan, random.Random(f"{meta['theme']['rng_int']}/text/{ci}/{slot}"))
+        lines = cache[text_key]
+
+        base, d = content_frame(w, h, zoomed, lines, rng, brain, anchor)
+        # only photo frames carry colour; cards and noise are drawn in neutral
+        # greys already, so they keep their image
+        if style.get("black_white", False):
             base = to_grayscale(base)
-
+            d = ImageDraw.Draw(base)
+
+    else:
+        # a random window of a pooled plate: a fresh-looking frame for the
+        # cost of one crop copy, no per-frame RNG fill
+        plate = rng.choice(plan["noise_pool"])
+        ox = rng.randint(0, plate.width - w)
+        oy = rng.randint(0, plate.height - h)
+        base = plate.crop((ox, oy, ox + w, oy + h))
         d = ImageDraw.Draw(base)
-        overlay_vhs_osd(d, w, h, meta, osd, fi, rng, room_label)
-        glitch_errors(d, w, h, rng, brain)
 
-        # Jumpscare visuals
-        if fi in jump_set:
-            base = maybe_jumpscare_frame(base, rng)
+    # OSD goes on through the Draw of whichever image ended up as the base
+    overlay_vhs_osd(d, w, h, meta, osd, fi, rng, room_label)
+    glitch_errors(d, w, h, rng, brain)
 
-        # VHS pass
-        base, prev_arr = apply_vhs(base, style, rng, prev_arr)
+    # Jumpscare visuals
+    if plan["jump_mask"][fi]:
+        base = maybe_jumpscare_frame(base, rng)
 
-        (frames_dir / f"frame_{fi:06d}.png").write_bytes(_png_bytes(base))
+    # VHS pass: one copy into the caller's slot, then everything in place
+    np.copyto(out, np.asarray(base))
+    return apply_vhs_arr(out, style, rng, prev_arr)
 
 
-def _png_bytes(img: Image.Image) -> bytes:
-    import io
-    bio = io.BytesIO()
-    img.save(bio, "PNG")
-    return bio.getvalue()
+# per-process plan, installed by _init_worker
+_PLAN = None
 
+
+def _init_worker(plan: dict):
+    global _PLAN
+    _PLAN = plan
+
+
+def _render_chunk(start: int, end: int) -> bytearray:
+    """
+    Render frames [start, end) as one rgb24 buffer. Each chunk has its
+    own deterministic RNG streams, so chunks can render in any order on any
+    worker. The frame before `start` is rendered once and thrown away so
+    the p-frame smear has a previous frame across chunk seams too.
+    """
+    plan = _PLAN
+    meta = plan["meta"]
+    seed_int = meta["theme"]["rng_int"]
+    rng = random.Random(f"{seed_int}/{start}")
+
+    # each frame is rendered straight into its slot of the output buffer,
+    # so there is no per-frame array to allocate and nothing to copy out;
+    # the previous slot doubles as the p-frame smear's reference
+    buf = bytearray((end - start) * meta["h"] * meta["w"] * 3)
+    frames = np.frombuffer(buf, dtype=np.uint8).reshape(end - start, meta["h"], meta["w"], 3)
+    prev_arr = None
+    cache = {}   # per-chunk ken burns tracks and captions
+    if start > 0:
+        warm = np.empty((meta["h"], meta["w"], 3), dtype=np.uint8)
+        prev_arr = _render_frame(plan, start - 1, rng, None, cache, warm)
+    for i, fi in enumerate(range(start, end)):
+        prev_arr = _render_frame(plan, fi, rng, prev_arr, cache, frames[i])
+    return buf
+
+
+def render_frames(cfg: dict, meta: dict, bundle: dict) -> Iterator[bytearray]:
+    """
+    Render every frame, yielding packed rgb24 buffers (one per second of
+    video) in frame order, ready to write to the encoder's stdin.
+
+    Frames are rendered in one-second chunks across `video.workers`
+    processes (0 = one per CPU). Rendering starts on the first next().
+    """
+    plan = _plan_frames(cfg, meta, bundle)
+
+    fps = meta["fps"]
+    total_frames = plan["total_frames"]
+    chunks = [(a, min(total_frames, a + fps)) for a in range(0, total_frames, fps)]
+
+    workers = int(cfg["video"].get("workers", 0)) or os.cpu_count() or 1
+    if workers <= 1:
+        _init_worker(plan)
+        for a, b in chunks:
+            yield _render_chunk(a, b)
+        return
+
+    # the caller may already have threads running (audio synthesis), and
+    # forking a process with live threads can deadlock the child; start the
+    # workers from a clean forkserver instead where the platform has one.
+    # The plan travels through initargs either way.
+    ctx = None
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=_init_worker, initargs=(plan,)) as ex:
+        # keep a bounded number of chunks in flight so finished frames don't
+        # pile up in memory when the encoder is the slower side
+        pending = deque()
+        for a, b in chunks:
+            pending.append(ex.submit(_render_chunk, a, b))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
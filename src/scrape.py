@@ -1,9 +1,18 @@
+import hashlib
+import json
+import os
 import random
 import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 WIKI_API = "https://{lang}.wikipedia.org/w/api.php"
@@ -19,52 +28,153 @@ def _session():
         "Accept": "application/json,text/plain,*/*",
         "Accept-Language": "en-US,en;q=0.9",
     })
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32,
+                          max_retries=Retry(total=2, backoff_factor=0.3,
+                                            status_forcelist=[429, 502, 503, 504]))
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     return s
 
 
+# one session for the whole run, so connections to wikipedia / commons
+# stay alive between calls instead of paying TCP+TLS setup every request.
+# Built on first use; the lock covers the download threads racing for it.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _shared_session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _session()
+    return _SESSION
+
+
+# optional on-disk cache for API responses and images, so re-running the
+# same seed doesn't hit the network again; set up by configure_cache()
+_CACHE_DIR: Optional[Path] = None
+_CACHE_TTL_S = 24 * 3600.0
+
+
+def configure_cache(cache_dir, ttl_s: float = 24 * 3600.0):
+    """
+    Enable the scrape cache under `cache_dir` (None / "" turns it off).
+    API responses older than `ttl_s` are refetched; images never expire.
+    """
+    global _CACHE_DIR, _CACHE_TTL_S
+    _CACHE_DIR = Path(cache_dir) if cache_dir else None
+    _CACHE_TTL_S = float(ttl_s)
+
+
+# The cache is best-effort throughout: any OSError (unwritable or bogus
+# cache_dir, full disk, ...) counts as a miss and the network result is used.
+
+def _cache_path(kind: str, key: str) -> Optional[Path]:
+    if _CACHE_DIR is None:
+        return None
+    d = _CACHE_DIR / kind
+    try:
+        d.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return d / hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _cache_put(dst: Path, write):
+    # write-then-rename so concurrent readers never see a partial entry;
+    # `write` fills the temp path
+    tmp = dst.with_name(f"{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, dst)
+    except OSError:
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _cache_store(src: Path, dst: Path):
+    _cache_put(dst, lambda tmp: shutil.copyfile(src, tmp))
+
+
+def _get_json(url: str, params: dict) -> dict:
+    cached = _cache_path("api", url + "?" + json.dumps(params, sort_keys=True))
+    if cached is not None:
+        try:
+            if time.time() - cached.stat().st_mtime < _CACHE_TTL_S:
+                return json.loads(cached.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+    r = _shared_session().get(url, params=params, timeout=30)
+    r.raise_for_status()
+    data = r.json()
+    if cached is not None:
+        body = json.dumps(data)
+        _cache_put(cached, lambda tmp: tmp.write_text(body, encoding="utf-8"))
+    return data
+
+
+_WS_RE = re.compile(r"\s+")
+
+
 def _safe_text(s: str) -> str:
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    return _WS_RE.sub(" ", s).strip()
 
 
 def wiki_search(lang: str, query: str, limit: int = 6) -> List[str]:
-    s = _session()
-    r = s.get(WIKI_API.format(lang=lang), params={
+    data = _get_json(WIKI_API.format(lang=lang), {
         "action": "query",
         "list": "search",
         "srsearch": query,
         "format": "json",
         "srlimit": limit,
-    }, timeout=30)
-    r.raise_for_status()
-    data = r.json()
+    })
     return [x["title"] for x in data.get("query", {}).get("search", [])]
 
 
 def wiki_extract(lang: str, title: str) -> str:
-    s = _session()
-    r = s.get(WIKI_API.format(lang=lang), params={
+    data = _get_json(WIKI_API.format(lang=lang), {
         "action": "query",
         "prop": "extracts",
         "explaintext": 1,
         "titles": title,
         "format": "json",
         "exsectionformat": "plain",
-    }, timeout=30)
-    r.raise_for_status()
-    pages = r.json().get("query", {}).get("pages", {})
+    })
+    pages = data.get("query", {}).get("pages", {})
     if not pages:
         return ""
     page = next(iter(pages.values()))
     return page.get("extract", "") or ""
 
 
+def wiki_extracts(lang: str, titles: List[str]) -> Dict[str, str]:
+    """
+    Plain-text extracts for several titles as {title: extract}, in the
+    order given. TextExtracts only returns one full-article extract per
+    request, so the requests run side by side instead of being batched.
+    A title that fails to fetch maps to "".
+    """
+    def _one(t):
+        try:
+            return wiki_extract(lang, t)
+        except Exception:
+            return ""
+
+    if not titles:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(titles)) as ex:
+        return dict(zip(titles, ex.map(_one, titles)))
+
+
 def commons_search_image_urls(query: str, thumb_width: int = 1400, limit: int = 12) -> List[str]:
     """
     Search Wikimedia Commons directly (more reliable than page-embedded images).
     """
-    s = _session()
-    r = s.get(COMMONS_API, params={
+    data = _get_json(COMMONS_API, {
         "action": "query",
         "generator": "search",
         "gsrsearch": query,
@@ -74,9 +184,8 @@ def commons_search_image_urls(query: str, thumb_width: int = 1400, limit: int =
         "iiprop": "url",
         "iiurlwidth": thumb_width,
         "format": "json",
-    }, timeout=30)
-    r.raise_for_status()
-    pages = (r.json().get("query", {}) or {}).get("pages", {}) or {}
+    })
+    pages = (data.get("query", {}) or {}).get("pages", {}) or {}
     urls = []
     for _, p in pages.items():
         ii = (p.get("imageinfo") or [])
@@ -88,27 +197,64 @@ def commons_search_image_urls(query: str, thumb_width: int = 1400, limit: int =
     return urls
 
 
-def download_image(url: str, out_path: Path) -> bool:
-    s = _session()
+def download_image(url: str, out_path: Path, max_bytes: int = 0) -> bool:
+    """
+    Fetch one image to `out_path`. Responses that aren't image/* or are
+    larger than `max_bytes` (0 = no limit) are skipped; both are checked
+    on the response headers before any of the body is read.
+    """
+    cached = _cache_path("img", url)
+    if cached is not None:
+        try:
+            if not (max_bytes and cached.stat().st_size > max_bytes):
+                shutil.copyfile(cached, out_path)
+                return True
+        except OSError:
+            pass
+    s = _shared_session()
     try:
-        r = s.get(url, timeout=30)
-        r.raise_for_status()
-        out_path.write_bytes(r.content)
+        # stream to disk in 64 KiB pieces instead of holding the whole body;
+        # images are already compressed, so ask for them as-is, but go
+        # through iter_content so a server that encodes anyway is decoded
+        with s.get(url, timeout=30, stream=True, headers={"Accept-Encoding": "identity"}) as r:
+            r.raise_for_status()
+            ctype = r.headers.get("Content-Type", "")
+            if ctype and not ctype.startswith("image/"):
+                return False
+            if max_bytes and int(r.headers.get("Content-Length") or 0) > max_bytes:
+                return False
+            total = 0
+            with open(out_path, "wb") as f:
+                for chunk in r.iter_content(64 * 1024):
+                    total += len(chunk)
+                    if max_bytes and total > max_bytes:
+                        # no (or a wrong) Content-Length: stop at the cap
+                        raise ValueError("image over max_bytes")
+                    f.write(chunk)
+        if cached is not None:
+            _cache_store(out_path, cached)
         return True
     except Exception:
+        out_path.unlink(missing_ok=True)
         return False
 
 
 def pick_paragraphs(extract: str, max_paragraphs: int) -> List[str]:
-    parts = [p.strip() for p in extract.split("\n") if p.strip()]
-    # keep paragraphs with some substance
-    parts = [p for p in parts if len(p) > 90]
-    return [_safe_text(p) for p in parts[:max_paragraphs]]
+    out = []
+    for line in extract.split("\n"):
+        if len(out) >= max_paragraphs:
+            break
+        p = line.strip()
+        # keep paragraphs with some substance
+        if len(p) > 90:
+            out.append(_WS_RE.sub(" ", p))
+    return out
 
 
 def scrape_bundle(cfg: dict, theme: dict, workdir: Path) -> Dict:
     rng = random.Random(theme["rng_int"])
     lang = cfg["scrape"].get("wikipedia_lang", "en")
+    configure_cache(cfg["scrape"].get("cache_dir"), float(cfg["scrape"].get("cache_ttl_h", 24)) * 3600)
     anchor = theme["anchor"]
     brain = theme["brain"]
 
@@ -120,71 +266,89 @@ def scrape_bundle(cfg: dict, theme: dict, workdir: Path) -> Dict:
         "Field notes indicate repeated patterns at irregular intervals. The source remains unverified.",
     ]
 
-    # Titles
-    try:
-        titles = wiki_search(lang, anchor, limit=10)
-        if not titles:
-            titles = wiki_search(lang, brain, limit=10)
-        if not titles:
-            titles = fallback_titles
-    except Exception:
-        titles = fallback_titles
-
-    rng.shuffle(titles)
-    picked = titles[:3]
-
-    paras = []
-    image_paths = []
-    image_urls = []
-
     img_dir = workdir / "imgs"
     img_dir.mkdir(parents=True, exist_ok=True)
 
-    # Text
-    for t in picked:
-        try:
-            ex = wiki_extract(lang, t)
-            paras.extend(pick_paragraphs(ex, cfg["scrape"].get("max_wiki_paragraphs", 8)))
-        except Exception:
-            pass
-
-    if not paras:
-        paras = fallback_paras
+    # text and images don't depend on each other: run both pipelines side
+    # by side so the scrape takes max(text, images) rather than the sum.
+    # The image side shuffles with its own derived rng so the main rng
+    # sees the same draws however the two threads interleave.
+    img_rng = random.Random(f"{theme['rng_int']}/images")
 
-    # Images: Commons direct search (anchor + brain) so we actually get something
-    urls = []
-    if cfg["scrape"].get("allow_wikimedia", True) and cfg["scrape"].get("commons_search_fallback", True):
-        try:
-            urls.extend(commons_search_image_urls(anchor, limit=12))
-        except Exception:
-            pass
+    def _text_pipeline():
+        # Titles
         try:
-            urls.extend(commons_search_image_urls(brain, limit=12))
+            titles = wiki_search(lang, anchor, limit=10)
+            if not titles:
+                titles = wiki_search(lang, brain, limit=10)
+            if not titles:
+                titles = fallback_titles
         except Exception:
-            pass
+            titles = fallback_titles
 
-    # dedupe
-    seen = set()
-    urls2 = []
-    for u in urls:
-        if u in seen:
-            continue
-        seen.add(u)
-        urls2.append(u)
-
-    rng.shuffle(urls2)
-    max_images = int(cfg["scrape"].get("max_images", 10))
-    for u in urls2[:max_images]:
-        outp = img_dir / f"img_{len(image_paths):02d}.jpg"
-        if download_image(u, outp):
-            image_paths.append(str(outp))
-            image_urls.append(u)
-
-    tech = []
-    for _ in range(16):
-        code = rng.randint(100, 999)
-        hz = rng.randint(2000, 18000)
-        tech.append(f"{brain.upper()}-{code} / CARRIER {hz}Hz / CRC {rng.randint(100000, 999999)}")
+        rng.shuffle(titles)
+        picked = titles[:3]
+
+        # Text
+        paras = []
+        for ex_text in wiki_extracts(lang, picked).values():
+            paras.extend(pick_paragraphs(ex_text, cfg["scrape"].get("max_wiki_paragraphs", 8)))
+
+        if not paras:
+            paras = fallback_paras
+        return picked, paras
+
+    def _image_pipeline():
+        image_paths = []
+        image_urls = []
+
+        # Images: Commons direct search (anchor + brain) so we actually get something
+        urls = []
+        if cfg["scrape"].get("allow_wikimedia", True) and cfg["scrape"].get("commons_search_fallback", True):
+            def _search(q):
+                try:
+                    return commons_search_image_urls(q, limit=12)
+                except Exception:
+                    return []
+
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                for found in ex.map(_search, [anchor, brain]):
+                    urls.extend(found)
+
+        # dedupe, keeping first-seen order
+        urls2 = list(dict.fromkeys(urls))
+
+        img_rng.shuffle(urls2)
+        max_images = int(cfg["scrape"].get("max_images", 10))
+        max_bytes = int(cfg["scrape"].get("max_image_bytes", 0))
+        cand = urls2[:max_images]
+        if cand:
+            def _fetch(iu):
+                i, u = iu
+                outp = img_dir / f"img_{i:02d}.jpg"
+                return u, outp, download_image(u, outp, max_bytes)
+
+            # downloads are pure network wait, so run them side by side
+            with ThreadPoolExecutor(max_workers=min(8, len(cand))) as ex:
+                results = list(ex.map(_fetch, enumerate(cand)))
+            for u, outp, ok in results:
+                if ok:
+                    image_paths.append(str(outp))
+                    image_urls.append(u)
+        return image_paths, image_urls
+
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        text_job = ex.submit(_text_pipeline)
+        image_job = ex.submit(_image_pipeline)
+        picked, paras = text_job.result()
+        image_paths, image_urls = image_job.result()
+
+    # f-string fields evaluate left to right: code, carrier, crc per line
+    tag = brain.upper()
+    tech = [
+        f"{tag}-{rng.randint(100, 999)} / CARRIER {rng.randint(2000, 18000)}Hz / CRC {rng.randint(100000, 999999)}"
+        for _ in range(16)
+    ]
 
     return {
         "titles": picked,
@@ -1,6 +1,7 @@
 import hashlib
 import time
 import random
+from functools import lru_cache
 
 
 KEYWORDS = [
@@ -27,6 +28,7 @@ ROOMS = [
 ]
 
 
+@lru_cache(maxsize=64)
 def _stable_int(s: str) -> int:
     h = hashlib.sha256(s.encode("utf-8")).hexdigest()
     return int(h[:16], 16)
@@ -36,7 +38,8 @@ def make_seed_and_theme(seed_cfg: str):
     if seed_cfg == "AUTO":
         seed_cfg = str(int(time.time()))
     seed = seed_cfg
-    rng = random.Random(_stable_int(seed))
+    rng_int = _stable_int(seed)
+    rng = random.Random(rng_int)
 
     # “brain keyword” that drives everything
     brain = rng.choice(KEYWORDS)
@@ -55,6 +58,6 @@ def make_seed_and_theme(seed_cfg: str):
         "topic": topic,
         "anchor": anchor,
         "rooms": rooms,        # list of (room_name, room_note)
-        "rng_int": _stable_int(seed),
+        "rng_int": rng_int,
     }
 
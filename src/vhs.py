@@ -1,5 +1,7 @@
 import math
 import random
+from functools import lru_cache
+
 import numpy as np
 from PIL import Image
 
@@ -8,33 +10,52 @@ def to_grayscale(img: Image.Image) -> Image.Image:
     return img.convert("L").convert("RGB")
 
 
-def add_scanlines(arr: np.ndarray, strength: float, rng: random.Random):
-    h, w, _ = arr.shape
+@lru_cache(maxsize=8)
+def _scanline_line(h: int, strength: float) -> np.ndarray:
+    """
+    Per-row scanline gain as float32, shaped (h, 1, 1) to broadcast.
+    """
     line = (np.arange(h) % 2).astype(np.float32)
     line = (1.0 - strength * 0.12) + (line * strength * 0.06)
-    arr[:, :, 0] = np.clip(arr[:, :, 0] * line[:, None], 0, 255)
-    arr[:, :, 1] = np.clip(arr[:, :, 1] * line[:, None], 0, 255)
-    arr[:, :, 2] = np.clip(arr[:, :, 2] * line[:, None], 0, 255)
+    line = line[:, None, None]
+    line.flags.writeable = False   # shared between calls
+    return line
 
 
-def add_noise(arr: np.ndarray, strength: float, rng: random.Random):
-    h, w, _ = arr.shape
-    n = rng.random()
+@lru_cache(maxsize=4)
+def _noise_buf(h: int, w: int) -> np.ndarray:
+    # scratch for one frame of gaussian noise, reused frame to frame
+    return np.empty((h, w, 1), dtype=np.float32)
+
+
+def _gauss_noise(h: int, w: int, strength: float, rng: random.Random) -> np.ndarray:
+    """
+    One frame of monochrome gaussian noise as int16, shaped (h, w, 1).
+    """
     sigma = 6 + strength * 18
-    noise = np.random.normal(0, sigma, size=(h, w, 1)).astype(np.float32)
-    arr[:] = np.clip(arr.astype(np.float32) + noise, 0, 255)
+    # PCG64 ziggurat straight into float32 scratch, seeded from the frame rng
+    gen = np.random.default_rng(rng.getrandbits(64))
+    noise = _noise_buf(h, w)
+    gen.standard_normal(out=noise, dtype=np.float32)
+    noise *= sigma
+    return noise.astype(np.int16)
 
 
 def jitter(arr: np.ndarray, strength: float, rng: random.Random):
     h, w, _ = arr.shape
     # horizontal jitter by rows
     max_shift = int(2 + strength * 8)
-    out = arr.copy()
-    for y in range(h):
-        if rng.random() < 0.35 * strength:
-            s = rng.randint(-max_shift, max_shift)
-            out[y] = np.roll(out[y], s, axis=0)
-    arr[:] = out
+    # per-row shifts in one vectorized draw, seeded from the frame rng so
+    # the result stays deterministic
+    gen = np.random.default_rng(rng.getrandbits(64))
+    shifts = gen.integers(-max_shift, max_shift + 1, size=h)
+    shifts[gen.random(h) >= 0.35 * strength] = 0
+    # roll all rows sharing a shift in one go (at most 2*max_shift+1 passes)
+    for s in np.unique(shifts):
+        if s == 0:
+            continue
+        rows = np.flatnonzero(shifts == s)
+        arr[rows] = np.roll(arr[rows], s, axis=1)
 
 
 def dropouts(arr: np.ndarray, strength: float, rng: random.Random):
@@ -45,59 +66,102 @@ def dropouts(arr: np.ndarray, strength: float, rng: random.Random):
             y = rng.randint(0, h - 1)
             bh = rng.randint(2, int(6 + strength * 18))
             y2 = min(h, y + bh)
-            # white/black dropout strip
+            # white/black dropout strip: 1/4 picture + 3/4 val, in integers
             val = 20 if rng.random() < 0.5 else 235
-            arr[y:y2, :, :] = np.clip(arr[y:y2, :, :].astype(np.float32) * 0.25 + val * 0.75, 0, 255).astype(np.uint8)
+            strip = arr[y:y2] >> 2
+            strip += (val * 3) >> 2
+            arr[y:y2] = strip
 
 
-def chroma_shift(arr: np.ndarray, px: int):
+def _store_chroma_shifted(dst: np.ndarray, src: np.ndarray, px: int):
+    """
+    dst[:] = src with the chroma misalignment applied on the way: red
+    rolled right and blue rolled left by px (cyclic). src and dst are
+    different arrays, so the shifted channel stores need no scratch.
+    """
     if px <= 0:
+        dst[:] = src
         return
-    # simulate chroma misalignment by shifting channels
-    arr[:, :, 0] = np.roll(arr[:, :, 0], px, axis=1)
-    arr[:, :, 2] = np.roll(arr[:, :, 2], -px, axis=1)
+    dst[:, :, 1] = src[:, :, 1]
+    dst[:, px:, 0] = src[:, :-px, 0]
+    dst[:, :px, 0] = src[:, -px:, 0]
+    dst[:, :-px, 2] = src[:, px:, 2]
+    dst[:, -px:, 2] = src[:, :px, 2]
+
 
+def _flicker_gain(amount: float, rng: random.Random) -> float:
+    return 1.0 + (rng.random() * 2 - 1) * amount * 0.12
 
-def flicker(arr: np.ndarray, amount: float, rng: random.Random):
-    # global brightness flicker
-    f = 1.0 + (rng.random() * 2 - 1) * amount * 0.12
-    arr[:] = np.clip(arr.astype(np.float32) * f, 0, 255).astype(np.uint8)
+
+def grade(arr: np.ndarray, cfg_style: dict, rng: random.Random):
+    """
+    Scanlines, flicker, noise and chroma shift in a single pass over the
+    frame: the per-row scanline gain and the frame's flicker gain fold
+    into one 1.7 fixed-point multiply, the noise is added and clipped
+    once, and the result is stored back with the channels shifted.
+    """
+    h, w, _ = arr.shape
+    strength = cfg_style.get("vhs_strength", 0.8)
+    gain = _flicker_gain(cfg_style.get("film_flicker", 0.35), rng)
+    if cfg_style.get("scanlines", 1):
+        gain = _scanline_line(h, round(float(strength), 3)) * gain
+    else:
+        gain = np.float32(gain)
+    # 1.7 fixed point: gains below 2x keep 255 * k inside uint16, and the
+    # shifted result (< 512) is a valid int16 for the signed noise add
+    k = np.clip(np.round(gain * 128), 0, 255).astype(np.uint16)
+    tmp = arr * k
+    tmp >>= 7
+    tmp = tmp.view(np.int16)
+    tmp += _gauss_noise(h, w, strength, rng)
+    np.clip(tmp, 0, 255, out=tmp)
+    _store_chroma_shifted(arr, tmp, int(cfg_style.get("chroma_shift", 1)))
 
 
 def pframe_smear(cur: np.ndarray, prev: np.ndarray, strength: float, rng: random.Random):
     """
     Temporal block smear to evoke inter-frame compression artifacts.
+    Blends into `cur` in place (prev must be a different array) and
+    returns it.
     """
     if prev is None or strength <= 0:
         return cur
     h, w, _ = cur.shape
-    out = cur.copy()
+    out = cur
     bs = int(8 + strength * 24)
     blocks = int(10 + strength * 60)
+    # draw every block up front (same rng order as before), then blend
+    spots = []
     for _ in range(blocks):
         x = rng.randint(0, max(0, w - bs))
         y = rng.randint(0, max(0, h - bs))
-        x2, y2 = x + bs, y + bs
-        # blend previous block into current with random alpha
         a = 0.25 + rng.random() * (0.55 * strength)
-        out[y:y2, x:x2] = np.clip(
-            out[y:y2, x:x2].astype(np.float32) * (1 - a) + prev[y:y2, x:x2].astype(np.float32) * a,
-            0, 255
-        ).astype(np.uint8)
+        # strengths past ~1.36 push a over 1; the float path clipped that
+        spots.append((x, y, min(256, max(0, int(a * 256 + 0.5)))))
+    # blend previous block into current with random alpha, in 8.8 fixed
+    # point: 255 * 256 still fits uint16, no float temporaries or clip
+    for x, y, a8 in spots:
+        x2, y2 = x + bs, y + bs
+        blk = out[y:y2, x:x2].astype(np.uint16)
+        blk *= 256 - a8
+        blk += prev[y:y2, x:x2] * np.uint16(a8)
+        blk >>= 8
+        out[y:y2, x:x2] = blk
     return out
 
 
-def apply_vhs(img: Image.Image, cfg_style: dict, rng: random.Random, prev_arr: np.ndarray | None):
-    arr = np.array(img).astype(np.uint8)
-
-    if cfg_style.get("scanlines", 1):
-        add_scanlines(arr, cfg_style.get("vhs_strength", 0.8), rng)
-
-    add_noise(arr, cfg_style.get("vhs_strength", 0.8), rng)
+def apply_vhs_arr(arr: np.ndarray, cfg_style: dict, rng: random.Random, prev_arr: np.ndarray | None) -> np.ndarray:
+    """
+    Full VHS treatment of an HxWx3 uint8 array the caller owns (modified
+    in place). Returns the finished frame array.
+    """
+    # the per-pixel effects share one pass; flicker is a global gain, so
+    # taking it before the row shifts and dropouts barely changes the look.
+    # The chroma shift rides on that pass's store too: it is a cyclic shift
+    # along x, which commutes exactly with jitter's row rolls and with
+    # dropouts' whole-row blends.
+    grade(arr, cfg_style, rng)
     jitter(arr, cfg_style.get("jitter_strength", 0.6), rng)
     dropouts(arr, cfg_style.get("dropout_strength", 0.5), rng)
-    chroma_shift(arr, int(cfg_style.get("chroma_shift", 1)))
-    flicker(arr, cfg_style.get("film_flicker", 0.35), rng)
 
-    arr = pframe_smear(arr, prev_arr, cfg_style.get("pframe_smear", 0.4), rng)
-    return Image.fromarray(arr), arr
+    return pframe_smear(arr, prev_arr, cfg_style.get("pframe_smear", 0.4), rng)